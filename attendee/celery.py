@@ -7,16 +7,16 @@ from celery import Celery
 # Set the default Django settings module
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "attendee.settings")
 
-sslCertRequirements = None
+REDIS_SSL_CERT_REQUIREMENTS = {
+    "none": ssl.CERT_NONE,
+    "optional": ssl.CERT_OPTIONAL,
+    "required": ssl.CERT_REQUIRED,
+}
+
 if os.getenv("DISABLE_REDIS_SSL"):
     sslCertRequirements = ssl.CERT_NONE
-elif os.getenv("REDIS_SSL_REQUIREMENTS"):
-    if os.getenv("REDIS_SSL_REQUIREMENTS") == "none":
-        sslCertRequirements = ssl.CERT_NONE
-    elif os.getenv("REDIS_SSL_REQUIREMENTS") == "optional":
-        sslCertRequirements = ssl.CERT_OPTIONAL
-    elif os.getenv("REDIS_SSL_REQUIREMENTS") == "required":
-        sslCertRequirements = ssl.CERT_REQUIRED
+else:
+    sslCertRequirements = REDIS_SSL_CERT_REQUIREMENTS.get(os.getenv("REDIS_SSL_REQUIREMENTS"))
 
 # Create the Celery app
 if sslCertRequirements is not None:
@@ -32,8 +32,9 @@ else:
 # tags. This is mainly to prevent CROSSSLOT errors when using Redis Cluster (https://github.com/celery/celery/issues/8276#issuecomment-3714489309)
 # For this case set CELERY_BROKER_TRANSPORT_OPTIONS='{"global_keyprefix":"{celeryattendee}:","fanout_prefix":true,"fanout_patterns":true}'
 
-if os.getenv("CELERY_BROKER_TRANSPORT_OPTIONS"):
-    app.conf.update(broker_transport_options=json.loads(os.getenv("CELERY_BROKER_TRANSPORT_OPTIONS")))
+broker_transport_options = os.getenv("CELERY_BROKER_TRANSPORT_OPTIONS")
+if broker_transport_options:
+    app.conf.update(broker_transport_options=json.loads(broker_transport_options))
 
 # Load configuration from Django settings
 app.config_from_object("django.conf:settings", namespace="CELERY")
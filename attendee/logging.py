@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+import time
 
 from pythonjsonlogger import jsonlogger
 
@@ -8,10 +8,26 @@ class ISOJsonFormatter(jsonlogger.JsonFormatter):
     JSON formatter that adds ISO 8601 timestamp
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (whole second, formatted "YYYY-MM-DDTHH:MM:SS") of the most recent record.
+        # Consecutive records usually fall in the same second, so this skips strftime for most of them.
+        self._last_second = (None, None)
+
     def add_fields(self, log_record, record, message_dict):
         super().add_fields(log_record, record, message_dict)
 
         # Add ISO timestamp from the record's created time
         # record.created is a Unix timestamp (float)
-        dt = datetime.fromtimestamp(record.created, tz=timezone.utc)
-        log_record["timestamp"] = dt.isoformat()
+        created = record.created
+        second = int(created)
+        # Round to the nearest microsecond like datetime.fromtimestamp does, carrying into the next second
+        microsecond = round((created - second) * 1_000_000)
+        if microsecond >= 1_000_000:
+            second += 1
+            microsecond -= 1_000_000
+        cached_second, formatted_second = self._last_second
+        if cached_second != second:
+            formatted_second = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._last_second = (second, formatted_second)
+        log_record["timestamp"] = f"{formatted_second}.{microsecond:06d}+00:00"
@@ -4,7 +4,7 @@ from .base import *
 
 DEBUG = True
 SITE_DOMAIN = "localhost:8000"
-ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS", "localhost").split(",")
+ALLOWED_HOSTS = tuple(os.getenv("ALLOWED_HOSTS", "localhost").split(","))
 
 DATABASES = {
     "default": {
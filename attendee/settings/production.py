@@ -7,7 +7,7 @@ from .base import *
 from .base import LOG_FORMATTERS
 
 DEBUG = False
-ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS", "*").split(",")
+ALLOWED_HOSTS = tuple(os.getenv("ALLOWED_HOSTS", "*").split(","))
 
 DATABASES = {
     "default": dj_database_url.config(
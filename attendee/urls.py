@@ -17,10 +17,11 @@ Including another URLconf
 
 import json
 import os
+from functools import lru_cache
 
 from django.conf import settings
 from django.contrib import admin
-from django.http import HttpResponse, JsonResponse
+from django.http import HttpResponse
 from django.urls import include, path
 from drf_spectacular.views import (
     SpectacularAPIView,
@@ -35,7 +36,10 @@ def health_check_view(request):
     return HttpResponse(status=200)
 
 
-def version_view(request):
+@lru_cache(maxsize=1)
+def _version_response_content():
+    # version.json and the release env var don't change while the process is running,
+    # so read and serialize them once instead of on every request
     version_path = os.path.join(settings.BASE_DIR, "version.json")
     with open(version_path, "r", encoding="utf-8") as version_file:
         version_data = json.load(version_file)
@@ -43,8 +47,13 @@ def version_view(request):
     response_data = {"version": version_data.get("version")}
     if cuber_release:
         response_data["cuber_release"] = cuber_release
-    return JsonResponse(
-        response_data,
+    return json.dumps(response_data)
+
+
+def version_view(request):
+    return HttpResponse(
+        _version_response_content(),
+        content_type="application/json",
         status=200,
     )
 
@@ -1,11 +1,29 @@
 import logging
+import queue
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Callable, Dict, Optional
 
+from azure.core.exceptions import HttpResponseError, ServiceRequestError, ServiceResponseError
+from botocore.exceptions import BotoCoreError, ClientError
 from django.core.files.base import ContentFile
 from django.core.files.storage import storages
 
+# Number of times a chunk upload is attempted before it is reported as failed
+UPLOAD_MAX_ATTEMPTS = 3
+
+
+def _is_retryable_upload_error(e: Exception) -> bool:
+    """Throttling, 5xx and transport errors might succeed on retry. Anything else (bad credentials, missing bucket, invalid name, etc.) won't."""
+    if isinstance(e, ClientError):
+        status_code = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode") or 0
+        return status_code == 429 or status_code >= 500
+    if isinstance(e, HttpResponseError):
+        status_code = e.status_code or 0
+        return status_code == 429 or status_code >= 500
+    return isinstance(e, (BotoCoreError, OSError, ServiceRequestError, ServiceResponseError))
+
 
 class AudioChunkUploader:
     """
@@ -36,6 +54,8 @@ class AudioChunkUploader:
         self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="uploader")
         self._lock = threading.Lock()
         self._pending_uploads: Dict[int, Dict] = {}  # audio_chunk_id -> upload info
+        # audio_chunk_ids of finished uploads, pushed by the futures' done callbacks
+        self._completed_uploads: queue.SimpleQueue = queue.SimpleQueue()
 
     def upload(
         self,
@@ -68,23 +88,29 @@ class AudioChunkUploader:
             }
             inflight = len(self._pending_uploads)
 
+        # Registered after the upload is in _pending_uploads; if it already finished, this runs immediately
+        fut.add_done_callback(lambda _fut: self._completed_uploads.put(audio_chunk_id))
+
         self.log.info("AudioChunkUploader queued audio_chunk_id=%s, inflight=%s", audio_chunk_id, inflight)
 
     def process_uploads(self):
         """
         Process completed uploads. Call this from the main thread at regular intervals.
 
-        Iterates over completed uploads, removes them from the in-memory store,
-        and calls the appropriate callback.
+        Drains the uploads that have completed since the last call, removes them from
+        the in-memory store, and calls the appropriate callback.
         """
         completed = []
 
-        with self._lock:
-            for audio_chunk_id, upload_info in list(self._pending_uploads.items()):
-                fut = upload_info["future"]
-                if fut.done():
-                    completed.append((audio_chunk_id, upload_info))
-                    del self._pending_uploads[audio_chunk_id]
+        while True:
+            try:
+                audio_chunk_id = self._completed_uploads.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                upload_info = self._pending_uploads.pop(audio_chunk_id, None)
+            if upload_info is not None:
+                completed.append((audio_chunk_id, upload_info))
 
         for audio_chunk_id, upload_info in completed:
             fut = upload_info["future"]
@@ -103,8 +129,17 @@ class AudioChunkUploader:
                         self.log.exception("on_error callback failed for audio_chunk_id=%s", audio_chunk_id)
 
     def _upload_one(self, filename: str, data: bytes) -> str:
-        # storage.save may alter the name (avoid collisions), so use return value
-        return self.storage.save(filename, ContentFile(data))
+        # Retries happen here in the worker thread, so they never block the main thread
+        for attempt in range(UPLOAD_MAX_ATTEMPTS):
+            try:
+                # storage.save may alter the name (avoid collisions), so use return value
+                return self.storage.save(filename, ContentFile(data))
+            except Exception as e:
+                if attempt == UPLOAD_MAX_ATTEMPTS - 1 or not _is_retryable_upload_error(e):
+                    raise
+                backoff_seconds = 2**attempt
+                self.log.warning("Upload attempt %d/%d failed for filename=%s, retrying in %ss: %s", attempt + 1, UPLOAD_MAX_ATTEMPTS, filename, backoff_seconds, e)
+                time.sleep(backoff_seconds)
 
     def shutdown(self, wait: bool = True, cancel_futures: bool = False):
         self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
@@ -116,20 +151,19 @@ class AudioChunkUploader:
         Args:
             timeout: Maximum time to wait in seconds (default 5.0)
         """
-        import time
-
-        start_time = time.time()
+        start_time = time.monotonic()
         while True:
             self.process_uploads()
 
             with self._lock:
-                pending_count = len(self._pending_uploads)
+                pending_futures = [upload_info["future"] for upload_info in self._pending_uploads.values()]
+            pending_count = len(pending_futures)
 
             if pending_count == 0:
                 self.log.info("wait_for_uploads: all uploads completed")
                 return
 
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             if elapsed >= timeout:
                 self.log.warning("wait_for_uploads: timeout after %.1fs with %d uploads still pending", elapsed, pending_count)
                 # Call on_error for all pending uploads
@@ -141,4 +175,5 @@ class AudioChunkUploader:
                             self.log.exception("on_error callback failed for audio_chunk_id=%s", audio_chunk_id)
                 return
 
-            time.sleep(0.1)
+            # Sleep until at least one upload finishes (or the deadline passes) instead of polling
+            wait(pending_futures, timeout=timeout - elapsed, return_when=FIRST_COMPLETED)
@@ -642,11 +642,8 @@ class BotController:
         self.cleanup_called = True
 
         normal_quitting_process_worked = False
-        import threading
 
         def terminate_worker():
-            import time
-
             time.sleep(600)
             if normal_quitting_process_worked:
                 logger.info("Normal quitting process worked, not force terminating worker")
@@ -708,6 +705,10 @@ class BotController:
         if self.audio_chunk_uploader:
             self.audio_chunk_uploader.shutdown()
 
+        if self.bot_resource_snapshot_taker:
+            logger.info("Telling resource snapshot taker to save its last snapshot...")
+            self.bot_resource_snapshot_taker.shutdown()
+
         if self.bot_in_db.state == BotStates.POST_PROCESSING:
             self.wait_until_all_utterances_are_terminated()
             BotEventManager.create_event(bot=self.bot_in_db, event_type=BotEventTypes.POST_PROCESSING_COMPLETED)
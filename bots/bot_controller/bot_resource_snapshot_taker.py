@@ -1,8 +1,13 @@
 import datetime
+import heapq
 import logging
+import os
+import re
 import threading
 import urllib.request
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from django.utils import timezone
 
@@ -14,6 +19,13 @@ logger = logging.getLogger(__name__)
 from pathlib import Path
 
 
+@lru_cache(maxsize=None)
+def _established_connection_pattern(port: int) -> re.Pattern:
+    # Matches a rem_address (8 hex digits for IPv4, 32 for IPv6) with the given port, followed by state 01 (ESTABLISHED).
+    # The kernel prints these fields as upper-case hex, e.g. " 0A0A0A0A:1538 01 ".
+    return re.compile(rb" [0-9A-F]{8}(?:[0-9A-F]{24})?:%s 01 " % format(port, "04X").encode("ascii"))
+
+
 def _get_established_connection_count(port: int) -> int:
     """
     Count established TCP connections to the specified remote port.
@@ -26,26 +38,12 @@ def _get_established_connection_count(port: int) -> int:
     where rem_address is hex IP:PORT and st is connection state (01 = ESTABLISHED).
     """
     count = 0
-    port_hex = format(port, "04X")
+    pattern = _established_connection_pattern(port)
 
     for tcp_file in [Path("/proc/net/tcp"), Path("/proc/net/tcp6")]:
         try:
-            with tcp_file.open() as f:
-                next(f, None)  # Skip header line
-                for line in f:
-                    parts = line.split()
-                    if len(parts) < 4:
-                        continue
-
-                    rem_address = parts[2]
-                    state = parts[3]
-
-                    # Remote port is after the colon in rem_address (e.g., "0A0A0A0A:1538")
-                    if ":" in rem_address:
-                        rem_port = rem_address.split(":")[1].upper()
-                        # State 01 = ESTABLISHED
-                        if rem_port == port_hex and state == "01":
-                            count += 1
+            # Match over the whole file at once rather than splitting every line in Python
+            count += len(pattern.findall(tcp_file.read_bytes()))
         except (FileNotFoundError, PermissionError):
             continue
 
@@ -73,36 +71,31 @@ def get_process_memory_list():
 
     Sorted by memory descending (largest first).
     """
-    proc_root = Path("/proc")
     memory_by_name_kb = defaultdict(int)
 
-    for entry in proc_root.iterdir():
-        # Only numeric dirs are PIDs
-        if not entry.name.isdigit():
-            continue
-
-        pid_dir = entry
-        smaps_rollup_path = pid_dir / "smaps_rollup"
-        comm_path = pid_dir / "comm"
+    # os.scandir yields plain DirEntry objects, so no Path objects are built per PID
+    with os.scandir("/proc") as proc_entries:
+        pid_dirs = [entry.path for entry in proc_entries if entry.name.isdigit()]  # Only numeric dirs are PIDs
 
+    for pid_dir in pid_dirs:
         try:
-            # Read PSS from smaps_rollup (kB)
-            pss_kb = None
-            with smaps_rollup_path.open() as f:
-                for line in f:
-                    # Example: "Pss:          12345 kB"
-                    if line.startswith("Pss:"):
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            pss_kb = int(parts[1])
-                        break
-
-            if pss_kb is None:
+            # Read PSS from smaps_rollup (kB). The file is a handful of lines, so read it in one go
+            # and search for the field instead of iterating over it line by line.
+            # Example line: "Pss:          12345 kB"
+            with open(pid_dir + "/smaps_rollup") as f:
+                smaps_rollup = f.read()
+            pss_start = smaps_rollup.find("\nPss:")
+            if pss_start == -1:
+                continue
+            pss_fields = smaps_rollup[pss_start + 5 : smaps_rollup.find("\n", pss_start + 1)].split()
+            if not pss_fields:
                 continue
+            pss_kb = int(pss_fields[0])
 
             # Get a human-ish name; fall back to something generic if missing
             try:
-                name = comm_path.read_text().strip() or "unknown"
+                with open(pid_dir + "/comm") as f:
+                    name = f.read().strip() or "unknown"
             except FileNotFoundError:
                 name = "unknown"
 
@@ -122,21 +115,23 @@ def get_process_memory_list():
         for name, total_kb in memory_by_name_kb.items()
     ]
 
-    # Sort by memory descending (largest first)
-    processes.sort(key=lambda p: p["memory_megabytes"], reverse=True)
-
-    # Get total memory and add a percentage of the total memory to the processes
+    # Percentages are relative to the memory of all processes, not just the top 5
     total_memory = sum(p["memory_megabytes"] for p in processes) or 1
-    for process in processes:
+
+    # Take top 5 “names”, sorted by memory descending (largest first)
+    top_5_processes = heapq.nlargest(5, processes, key=lambda p: p["memory_megabytes"])
+    for process in top_5_processes:
         process["memory_percentage"] = process["memory_megabytes"] / total_memory * 100
 
-    # Take top 5 “names”
-    top_5_processes = processes[:5]
     return top_5_processes
 
 
+@lru_cache(maxsize=1)
 def _detect_cgroup_layout():
-    """Return paths to the usage and stat files for this container."""
+    """Return paths to the usage and stat files for this container.
+
+    The cgroup layout can't change while the container is running, so this is only computed once.
+    """
     # cgroup v2 has /sys/fs/cgroup/cgroup.controllers
     if Path("/sys/fs/cgroup/cgroup.controllers").exists():
         root = Path("/sys/fs/cgroup")  # unified v2 mount
@@ -175,39 +170,42 @@ def container_memory_mib() -> int:
     return working_set // (1024 * 1024)
 
 
+def _read_cpu_usage_v2(path: Path, scale: int) -> int:
+    """cgroup v2 – grab `usage_usec` (first field of cpu.stat)"""
+    with path.open() as fh:
+        for line in fh:
+            if line.startswith("usage_usec"):
+                return int(line.split()[1]) // scale  # µs → mcore·s
+    raise RuntimeError("usage_usec not found in cpu.stat")
+
+
+def _read_cpu_usage_v1(path: Path, scale: int) -> int:
+    """cgroup v1 – cpuacct.usage (ns)"""
+    return int(path.read_text().strip()) // scale  # ns → mcore·s
+
+
+@lru_cache(maxsize=1)
 def _detect_cpu_files():
     """
-    Return (usage_path, scale) where:
+    Return (usage_path, scale, reader) where:
       * usage_path is a Path that yields a growing CPU-usage counter
       * scale converts that counter’s units into millicores/second
         (10**6 for cgroup v1 nanoseconds, 10**3 for v2 microseconds)
+      * reader(usage_path, scale) returns the cumulative CPU usage, already
+        divided by *scale* so that 1 unit = 1 millicore×second
+
+    Cached, since the cgroup layout can't change while the container is running.
     """
     # unified cgroup v2 mount has this file
     if Path("/sys/fs/cgroup/cgroup.controllers").exists():
-        return Path("/sys/fs/cgroup/cpu.stat"), 1_000  # µs
+        return Path("/sys/fs/cgroup/cpu.stat"), 1_000, _read_cpu_usage_v2  # µs
     # legacy cgroup v1 layout
-    return Path("/sys/fs/cgroup/cpuacct/cpuacct.usage"), 1_000_000  # ns
-
-
-def _read_cpu_usage(path: Path, scale: int) -> int:
-    """
-    Read the cumulative CPU usage, already divided by *scale* so that
-    1 unit = 1 millicore×second.
-    """
-    if "cpu.stat" in str(path):
-        # cgroup v2 – grab `usage_usec` (first field of cpu.stat)
-        with path.open() as fh:
-            for line in fh:
-                if line.startswith("usage_usec"):
-                    return int(line.split()[1]) // scale  # µs → mcore·s
-        raise RuntimeError("usage_usec not found in cpu.stat")
-    # cgroup v1 – cpuacct.usage (ns)
-    return int(path.read_text().strip()) // scale  # ns → mcore·s
+    return Path("/sys/fs/cgroup/cpuacct/cpuacct.usage"), 1_000_000, _read_cpu_usage_v1  # ns
 
 
 def get_cpu_usage_millicores():
-    usage_file, scale = _detect_cpu_files()
-    return _read_cpu_usage(usage_file, scale)
+    usage_file, scale, read_cpu_usage = _detect_cpu_files()
+    return read_cpu_usage(usage_file, scale)
 
 
 def pod_cpu_millicores(window_seconds: int, u0: int, u1: int) -> int:
@@ -220,6 +218,10 @@ def pod_cpu_millicores(window_seconds: int, u0: int, u1: int) -> int:
     return int(delta_mcore_seconds / window_seconds)  # average over the window
 
 
+# One /proc/net/dev interface line: "  eth0: <8 receive counters> <8 transmit counters>"
+_NET_DEV_LINE_PATTERN = re.compile(rb"^[ \t]*([^\s:]+):[ \t]*" + rb"[ \t]+".join([rb"(\d+)"] * 16), re.MULTILINE)
+
+
 def get_network_interface_stats() -> dict:
     stats = {
         "rx_bytes": 0,
@@ -232,32 +234,20 @@ def get_network_interface_stats() -> dict:
         "tx_errors": 0,
     }
 
-    with open("/proc/net/dev", "r", encoding="ascii") as f:
-        for line in f:
-            if ":" not in line:
-                continue
-
-            iface, values = line.split(":", 1)
-            iface = iface.strip()
-            if iface == "lo":
-                continue
-
-            parts = values.split()
-            if len(parts) < 16:
-                continue
+    # Let the compiled pattern find the interface lines and their counters instead of splitting each line in Python.
+    # Header and malformed lines don't match and are skipped.
+    for match in _NET_DEV_LINE_PATTERN.finditer(Path("/proc/net/dev").read_bytes()):
+        if match.group(1) == b"lo":
+            continue
 
-            try:
-                stats["rx_bytes"] += int(parts[0])
-                stats["rx_packets"] += int(parts[1])
-                stats["rx_errors"] += int(parts[2])
-                stats["rx_dropped"] += int(parts[3])
-                stats["tx_bytes"] += int(parts[8])
-                stats["tx_packets"] += int(parts[9])
-                stats["tx_errors"] += int(parts[10])
-                stats["tx_dropped"] += int(parts[11])
-            except ValueError:
-                # Ignore malformed lines
-                continue
+        stats["rx_bytes"] += int(match.group(2))
+        stats["rx_packets"] += int(match.group(3))
+        stats["rx_errors"] += int(match.group(4))
+        stats["rx_dropped"] += int(match.group(5))
+        stats["tx_bytes"] += int(match.group(10))
+        stats["tx_packets"] += int(match.group(11))
+        stats["tx_errors"] += int(match.group(12))
+        stats["tx_dropped"] += int(match.group(13))
 
     return stats
 
@@ -306,6 +296,11 @@ class BotResourceSnapshotTaker:
         self._first_network_sample_time = None
         self._is_first_snapshot = True
         self._public_ip = None
+        # The per-minute sampling walks /proc and reads cgroup files, so it runs on a worker thread
+        # instead of the main loop. The finished sample is saved from the main thread on a later tick, or by shutdown().
+        self._snapshot_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="resource_snapshot")
+        self._snapshot_future = None
+        self._is_shut_down = False
 
         if self.bot.save_resource_snapshots():
             # It will make an API call to get the public IP, and we don't want to block the main thread on that.
@@ -315,12 +310,14 @@ class BotResourceSnapshotTaker:
         try:
             self._public_ip = get_public_ip()
         except Exception as e:
-            logger.warning(f"Could not get public IP for bot {self.bot.object_id}: {e}. Continuing...")
+            logger.warning("Could not get public IP for bot %s: %s. Continuing...", self.bot.object_id, e)
 
     def save_snapshot_if_needed(self):
-        if not self.bot.save_resource_snapshots():
+        if not self.bot.save_resource_snapshots() or self._is_shut_down:
             return
 
+        self._save_collected_snapshot_if_ready()
+
         now = timezone.now()
 
         # If it is more than 30 seconds since the last snapshot, sample the cpu usage.
@@ -329,21 +326,77 @@ class BotResourceSnapshotTaker:
                 self._first_cpu_usage_millicores = get_cpu_usage_millicores()
                 self._first_cpu_usage_sample_time = now
             except Exception as e:
-                logger.error(f"Error getting first cpu usage for bot {self.bot.object_id}: {e}")
+                logger.error("Error getting first cpu usage for bot %s: %s", self.bot.object_id, e)
                 return
 
             try:
                 self._first_network_stats = get_network_interface_stats()
                 self._first_network_sample_time = now
             except Exception as e:
-                logger.error(f"Error getting first network stats for bot {self.bot.object_id}: {e}")
+                logger.error("Error getting first network stats for bot %s: %s", self.bot.object_id, e)
 
         # Don't take a snapshot if it's been less than 1 minutes since the last snapshot.
         if (now - self._last_snapshot_time) < datetime.timedelta(minutes=1):
             return
 
+        # Don't start another sample while the previous one is still being collected
+        if self._snapshot_future is not None:
+            return
+
         # Update the last snapshot time in memory for subsequent checks
         self._last_snapshot_time = now
+
+        # Hand the first samples over to the worker, so the next window starts fresh
+        first_cpu_usage_millicores, first_cpu_usage_sample_time = self._first_cpu_usage_millicores, self._first_cpu_usage_sample_time
+        first_network_stats, first_network_sample_time = self._first_network_stats, self._first_network_sample_time
+        self._first_cpu_usage_millicores = None
+        self._first_cpu_usage_sample_time = None
+        self._first_network_stats = None
+        self._first_network_sample_time = None
+
+        self._snapshot_future = self._snapshot_executor.submit(
+            self._collect_snapshot_data,
+            now,
+            first_cpu_usage_millicores,
+            first_cpu_usage_sample_time,
+            first_network_stats,
+            first_network_sample_time,
+        )
+
+    def shutdown(self):
+        """Waits for the sample still being collected, saves it and stops the worker thread. Called when the bot is cleaned up."""
+        self._is_shut_down = True
+        if self._snapshot_future is not None:
+            self._save_collected_snapshot()
+        self._snapshot_executor.shutdown()
+
+    def _save_collected_snapshot_if_ready(self):
+        if self._snapshot_future is None or not self._snapshot_future.done():
+            return
+
+        self._save_collected_snapshot()
+
+    def _save_collected_snapshot(self):
+        future, self._snapshot_future = self._snapshot_future, None
+        try:
+            snapshot_data = future.result()
+        except Exception as e:
+            logger.error("Error collecting resource snapshot for bot %s: %s", self.bot.object_id, e)
+            return
+
+        if snapshot_data is None:
+            return
+
+        if self._is_first_snapshot and self._public_ip is not None:
+            snapshot_data["public_ip"] = self._public_ip
+        self._is_first_snapshot = False
+
+        BotResourceSnapshot.objects.create(bot=self.bot, data=snapshot_data)
+
+        logger.info("Saved resource snapshot for bot %s: %s", self.bot.object_id, snapshot_data)
+
+    def _collect_snapshot_data(self, now, first_cpu_usage_millicores, first_cpu_usage_sample_time, first_network_stats, first_network_sample_time):
+        """Runs on the snapshot worker thread. Returns the snapshot data, or None if it couldn't be collected."""
         ram_usage_megabytes = None
         cpu_usage_millicores_delta_per_second = None
 
@@ -351,55 +404,51 @@ class BotResourceSnapshotTaker:
             ram_usage_megabytes = container_memory_mib()
         except Exception as e:
             # Could log this error, but for now we will just skip taking the snapshot.
-            logger.error(f"Error getting memory usage for bot {self.bot.object_id}: {e}")
-            return
+            logger.error("Error getting memory usage for bot %s: %s", self.bot.object_id, e)
+            return None
 
-        if self._first_cpu_usage_millicores is not None:
+        if first_cpu_usage_millicores is not None:
             try:
                 second_cpu_usage_millicores = get_cpu_usage_millicores()
-                cpu_usage_millicores_delta_seconds = (now - self._first_cpu_usage_sample_time).total_seconds()
-                cpu_usage_millicores_delta_per_second = pod_cpu_millicores(cpu_usage_millicores_delta_seconds, self._first_cpu_usage_millicores, second_cpu_usage_millicores)
-                self._first_cpu_usage_millicores = None
-                self._first_cpu_usage_sample_time = None
+                cpu_usage_millicores_delta_seconds = (now - first_cpu_usage_sample_time).total_seconds()
+                cpu_usage_millicores_delta_per_second = pod_cpu_millicores(cpu_usage_millicores_delta_seconds, first_cpu_usage_millicores, second_cpu_usage_millicores)
             except Exception as e:
-                logger.error(f"Error getting second cpu usage for bot {self.bot.object_id}: {e}")
-                return
+                logger.error("Error getting second cpu usage for bot %s: %s", self.bot.object_id, e)
+                return None
 
         # Network deltas
         network_delta = None
-        if self._first_network_stats is not None:
+        if first_network_stats is not None:
             try:
                 current_network_stats = get_network_interface_stats()
-                elapsed = (now - self._first_network_sample_time).total_seconds()
-                network_delta = compute_network_deltas(self._first_network_stats, current_network_stats, elapsed)
-                self._first_network_stats = None
-                self._first_network_sample_time = None
+                elapsed = (now - first_network_sample_time).total_seconds()
+                network_delta = compute_network_deltas(first_network_stats, current_network_stats, elapsed)
             except Exception as e:
-                logger.error(f"Error getting network delta for bot {self.bot.object_id}: {e}")
+                logger.error("Error getting network delta for bot %s: %s", self.bot.object_id, e)
 
         if ram_usage_megabytes is None or cpu_usage_millicores_delta_per_second is None:
-            logger.error(f"Error getting resource usage for bot {self.bot.object_id}: {ram_usage_megabytes} or {cpu_usage_millicores_delta_per_second} was None")
-            return
+            logger.error("Error getting resource usage for bot %s: %s or %s was None", self.bot.object_id, ram_usage_megabytes, cpu_usage_millicores_delta_per_second)
+            return None
 
         processes = []
         try:
             processes = get_process_memory_list()
         except Exception as e:
-            logger.error(f"Error getting process memory list for bot {self.bot.object_id}: {e}. Continuing...")
+            logger.error("Error getting process memory list for bot %s: %s. Continuing...", self.bot.object_id, e)
 
         db_connection_count = None
         try:
             db_connection_count = get_db_connection_count()
         except Exception as e:
-            logger.error(f"Error getting db connection count for bot {self.bot.object_id}: {e}. Continuing...")
+            logger.error("Error getting db connection count for bot %s: %s. Continuing...", self.bot.object_id, e)
 
         redis_connection_count = None
         try:
             redis_connection_count = get_redis_connection_count()
         except Exception as e:
-            logger.error(f"Error getting redis connection count for bot {self.bot.object_id}: {e}. Continuing...")
+            logger.error("Error getting redis connection count for bot %s: %s. Continuing...", self.bot.object_id, e)
 
-        snapshot_data = {
+        return {
             "ram_usage_megabytes": ram_usage_megabytes,
             "cpu_usage_millicores": cpu_usage_millicores_delta_per_second,
             "processes": processes,
@@ -407,11 +456,3 @@ class BotResourceSnapshotTaker:
             "redis_connection_count": redis_connection_count,
             "network": network_delta,
         }
-
-        if self._is_first_snapshot and self._public_ip is not None:
-            snapshot_data["public_ip"] = self._public_ip
-        self._is_first_snapshot = False
-
-        BotResourceSnapshot.objects.create(bot=self.bot, data=snapshot_data)
-
-        logger.info(f"Saved resource snapshot for bot {self.bot.object_id}: {snapshot_data}")
@@ -0,0 +1,66 @@
+import logging
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Defaults to the number of CPUs (capped at 8) so a bot uploading many files at once can't balloon memory
+FILE_UPLOADER_MAX_WORKERS = int(os.getenv("FILE_UPLOADER_MAX_WORKERS") or min(8, os.cpu_count() or 4))
+
+
+class FileUploader(ABC):
+    """Base class for uploading local recording files to external storage.
+
+    Subclasses only implement _upload, which performs the storage-specific upload of a single file.
+    """
+
+    # Shared by all uploaders so that concurrent uploads reuse a bounded set of threads
+    _executor = ThreadPoolExecutor(max_workers=FILE_UPLOADER_MAX_WORKERS, thread_name_prefix="file_uploader")
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._upload_futures = []
+
+    def upload_file(self, file_path: str, callback=None):
+        """Start an asynchronous upload of a file.
+
+        Args:
+            file_path (str): Path to the local file to upload
+            callback (callable, optional): Function to call when upload completes; receives True/False
+        """
+        self._upload_futures.append(self._executor.submit(self._upload_worker, file_path, callback))
+
+    def _upload_worker(self, file_path: str, callback=None):
+        """Background thread that handles the actual file upload.
+
+        Args:
+            file_path (str): Path to the local file to upload
+            callback (callable, optional): Function to call when upload completes
+        """
+        try:
+            # No exists() check up front; opening a missing file raises FileNotFoundError anyway
+            self._upload(Path(file_path))
+
+            if callback:
+                callback(True)
+
+        except Exception as e:
+            logger.error("Upload error: %s", e)
+            if callback:
+                callback(False)
+
+    @abstractmethod
+    def _upload(self, file_path: Path):
+        """Upload a single local file to storage. Raises on failure."""
+        pass
+
+    def wait_for_upload(self):
+        """Wait for all uploads started by this uploader to complete."""
+        wait(self._upload_futures)
+
+    def delete_file(self, file_path: str):
+        """Delete a file from the local filesystem."""
+        Path(file_path).unlink(missing_ok=True)
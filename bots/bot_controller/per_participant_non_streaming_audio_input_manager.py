@@ -1,24 +1,24 @@
 import logging
-import queue
 import time
+from collections import deque
 from datetime import datetime, timedelta
 
-import numpy as np
 import webrtcvad
 
-logger = logging.getLogger(__name__)
+from bots.utils import calculate_normalized_rms
 
+logger = logging.getLogger(__name__)
 
-def calculate_normalized_rms(audio_bytes):
-    samples = np.frombuffer(audio_bytes, dtype=np.int16)
-    rms = np.sqrt(np.mean(np.square(samples)))
-    # Normalize by max possible value for 16-bit audio (32768)
-    return rms / 32768
+# Chunks louder than this are treated as speech without consulting the VAD, which is far more
+# expensive than the RMS we have already computed and would almost always agree anyway.
+SPEECH_RMS_THRESHOLD = 0.05
 
 
 class PerParticipantNonStreamingAudioInputManager:
     def __init__(self, *, save_audio_chunk_callback, get_participant_callback, sample_rate, utterance_size_limit, silence_duration_limit, should_print_diagnostic_info):
-        self.queue = queue.Queue()
+        # Single producer (the audio thread) and single consumer (process_chunks). deque's append
+        # and popleft are atomic, so we don't need queue.Queue's locks and condition variables.
+        self.queue = deque()
 
         self.save_audio_chunk_callback = save_audio_chunk_callback
         self.get_participant_callback = get_participant_callback
@@ -30,14 +30,15 @@ class PerParticipantNonStreamingAudioInputManager:
         self.last_nonsilent_audio_time = {}
 
         self.UTTERANCE_SIZE_LIMIT = utterance_size_limit
-        self.SILENCE_DURATION_LIMIT = silence_duration_limit
+        # Kept as a timedelta so process_chunk can compare it with chunk time gaps directly
+        self.SILENCE_DURATION_LIMIT = timedelta(seconds=silence_duration_limit)
         self.vad = webrtcvad.Vad()
 
         self.should_print_diagnostic_info = should_print_diagnostic_info
         self.reset_diagnostic_info()
 
     def add_chunk(self, speaker_id, chunk_time, chunk_bytes):
-        self.queue.put((speaker_id, chunk_time, chunk_bytes))
+        self.queue.append((speaker_id, chunk_time, chunk_bytes))
         self.diagnostic_info["total_chunks_added"] += 1
 
     def reset_diagnostic_info(self):
@@ -46,6 +47,7 @@ class PerParticipantNonStreamingAudioInputManager:
             "total_chunks_marked_as_silent_due_to_vad": 0,
             "total_chunks_marked_as_silent_due_to_rms_being_small": 0,
             "total_chunks_marked_as_silent_due_to_rms_being_zero": 0,
+            "total_chunks_marked_as_speech_due_to_rms_being_large": 0,
             "total_chunks_too_large_for_vad": 0,
             "total_chunks_that_caused_vad_error": 0,
             "total_audio_chunks_sent": 0,
@@ -60,23 +62,21 @@ class PerParticipantNonStreamingAudioInputManager:
             self.reset_diagnostic_info()
 
     def process_chunks(self):
-        while not self.queue.empty():
-            speaker_id, chunk_time, chunk_bytes = self.queue.get()
+        while self.queue:
+            speaker_id, chunk_time, chunk_bytes = self.queue.popleft()
             self.process_chunk(speaker_id, chunk_time, chunk_bytes)
 
+        now = datetime.utcnow()
         for speaker_id in list(self.first_nonsilent_audio_time.keys()):
-            self.process_chunk(speaker_id, datetime.utcnow(), None)
+            self.process_chunk(speaker_id, now, None)
 
         self.print_diagnostic_info()
 
     # When the meeting ends, we need to flush all utterances. Do this by pretending that we received a chunk of silence at the end of the meeting.
     def flush_utterances(self):
+        end_of_meeting_time = datetime.utcnow() + self.SILENCE_DURATION_LIMIT + timedelta(seconds=1)
         for speaker_id in list(self.first_nonsilent_audio_time.keys()):
-            self.process_chunk(
-                speaker_id,
-                datetime.utcnow() + timedelta(seconds=self.SILENCE_DURATION_LIMIT + 1),
-                None,
-            )
+            self.process_chunk(speaker_id, end_of_meeting_time, None)
 
     def is_speech(self, chunk_bytes):
         try:
@@ -98,6 +98,9 @@ class PerParticipantNonStreamingAudioInputManager:
         if rms_value < 0.01:
             self.diagnostic_info["total_chunks_marked_as_silent_due_to_rms_being_small"] += 1
             return True
+        if rms_value > SPEECH_RMS_THRESHOLD:
+            self.diagnostic_info["total_chunks_marked_as_speech_due_to_rms_being_large"] += 1
+            return False
         if not self.is_speech(chunk_bytes):
             self.diagnostic_info["total_chunks_marked_as_silent_due_to_vad"] += 1
             return True
@@ -128,7 +131,7 @@ class PerParticipantNonStreamingAudioInputManager:
 
         # Check for silence
         if audio_is_silent:
-            silence_duration = (chunk_time - self.last_nonsilent_audio_time[speaker_id]).total_seconds()
+            silence_duration = chunk_time - self.last_nonsilent_audio_time[speaker_id]
             if silence_duration >= self.SILENCE_DURATION_LIMIT:
                 should_flush = True
                 reason = "silence_limit"
@@ -1,7 +1,6 @@
 import logging
 import time
 
-import numpy as np
 import webrtcvad
 
 from bots.models import (
@@ -15,43 +14,11 @@ from bots.transcription_providers.kyutai.kyutai_streaming_transcriber import (
     KyutaiStreamingTranscriber,
 )
 from bots.transcription_providers.utterance_handler import DefaultUtteranceHandler
+from bots.utils import calculate_normalized_rms
 
 logger = logging.getLogger(__name__)
 
 
-def calculate_normalized_rms(audio_bytes):
-    if not audio_bytes or len(audio_bytes) < 2:
-        return 0.0
-
-    try:
-        samples = np.frombuffer(audio_bytes, dtype=np.int16)
-        if len(samples) == 0:
-            return 0.0
-
-        # Check for any NaN or infinite values in samples
-        if not np.isfinite(samples).all():
-            return 0.0
-
-        # Calculate mean of squares first
-        mean_square = np.mean(np.square(samples.astype(np.float64)))
-
-        # Check if mean_square is valid before sqrt
-        if not np.isfinite(mean_square) or mean_square < 0:
-            return 0.0
-
-        rms = np.sqrt(mean_square)
-
-        # Handle NaN case (shouldn't happen with valid data, but be safe)
-        if not np.isfinite(rms):
-            return 0.0
-
-        # Normalize by max possible value for 16-bit audio (32768)
-        return rms / 32768
-    except (ValueError, TypeError, BufferError, FloatingPointError):
-        # If there's any issue with the audio data, treat as silence
-        return 0.0
-
-
 class PerParticipantStreamingAudioInputManager:
     def __init__(self, *, get_participant_callback, sample_rate, transcription_provider, bot):
         self.get_participant_callback = get_participant_callback
@@ -70,12 +37,20 @@ class PerParticipantStreamingAudioInputManager:
             self.SILENCE_DURATION_LIMIT = 300  # 5 minutes of inactivity
 
         self.vad = webrtcvad.Vad()
+        # WebRTC VAD only accepts 10, 20 or 30 ms frames of 16-bit audio, so work out the valid chunk sizes once
+        self.vad_frame_sizes = frozenset(frame_ms * sample_rate // 1000 * 2 for frame_ms in (10, 20, 30))
         self.transcription_provider = transcription_provider
         self.streaming_transcribers = {}
         self.last_nonsilent_audio_time = {}
 
         self.project = bot.project
         self.bot = bot
+        # bot.transcription_settings builds a new wrapper on every access, so build it once instead of once per
+        # lookup per new speaker. Transcription settings can be patched on a running bot, but only the
+        # meeting_closed_captions ones, which this manager doesn't read. If a deepgram/kyutai setting ever
+        # becomes patchable, this cached copy has to be refreshed when the patch is applied.
+        self.transcription_settings = bot.transcription_settings
+        self.base_transcriber_metadata = {"bot_id": bot.object_id, **(bot.metadata or {})}
         self.deepgram_api_key = self.get_deepgram_api_key()
         self.kyutai_server_url, self.kyutai_api_key = self.get_kyutai_server_url_and_api_key()
 
@@ -85,6 +60,9 @@ class PerParticipantStreamingAudioInputManager:
     def silence_detected(self, chunk_bytes):
         if calculate_normalized_rms(chunk_bytes) < 0.0025:
             return True
+        # The VAD raises on any other frame size, so rely on the RMS check alone for those chunks
+        if len(chunk_bytes) not in self.vad_frame_sizes:
+            return False
         return not self.vad.is_speech(chunk_bytes, self.sample_rate)
 
     def get_deepgram_api_key(self):
@@ -107,7 +85,7 @@ class PerParticipantStreamingAudioInputManager:
         api_key = kyutai_credentials.get("api_key", None) or "public_token"
 
         # Use server_url from transcription settings if available, otherwise use the one from project credentials
-        server_url = self.bot.transcription_settings.kyutai_server_url() or kyutai_credentials.get("server_url", "ws://127.0.0.1:8012/api/asr-streaming")
+        server_url = self.transcription_settings.kyutai_server_url() or kyutai_credentials.get("server_url", "ws://127.0.0.1:8012/api/asr-streaming")
 
         return server_url, api_key
 
@@ -117,14 +95,14 @@ class PerParticipantStreamingAudioInputManager:
             return DeepgramStreamingTranscriber(
                 deepgram_api_key=self.deepgram_api_key,
                 interim_results=True,
-                language=self.bot.transcription_settings.deepgram_language(),
+                language=self.transcription_settings.deepgram_language(),
                 sample_rate=self.sample_rate,
-                model=self.bot.transcription_settings.deepgram_model(),
-                callback=self.bot.transcription_settings.deepgram_callback(),
+                model=self.transcription_settings.deepgram_model(),
+                callback=self.transcription_settings.deepgram_callback(),
                 metadata=metadata_list,
-                redaction_settings=self.bot.transcription_settings.deepgram_redaction_settings(),
-                replace_settings=self.bot.transcription_settings.deepgram_replace_settings(),
-                mip_opt_out=self.bot.transcription_settings.deepgram_mip_opt_out(),
+                redaction_settings=self.transcription_settings.deepgram_redaction_settings(),
+                replace_settings=self.transcription_settings.deepgram_replace_settings(),
+                mip_opt_out=self.transcription_settings.deepgram_mip_opt_out(),
             )
         elif self.transcription_provider == TranscriptionProviders.KYUTAI:
 
@@ -156,7 +134,7 @@ class PerParticipantStreamingAudioInputManager:
         if participant_info is None:
             # Audio arrived before participant join was captured - skip creating transcriber for now
             return None
-        metadata = {"bot_id": self.bot.object_id, **(self.bot.metadata or {}), **participant_info}
+        metadata = {**self.base_transcriber_metadata, **participant_info}
         participant_name = metadata.get("participant_full_name", speaker_id)
 
         logger.info(f"Creating streaming transcriber for speaker {speaker_id} ({participant_name})")
@@ -3,12 +3,55 @@ import threading
 from pathlib import Path
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+
+from .file_uploader import FILE_UPLOADER_MAX_WORKERS, FileUploader
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# boto3 clients are thread-safe and keep their own HTTPS connection pool, so we share one
+# client per set of credentials instead of paying for client construction + TLS handshakes
+# every time a recording is uploaded.
+_s3_clients = {}
+_s3_clients_lock = threading.Lock()
+
+# Large recordings are uploaded as fixed-size multipart segments, a few at a time, so peak
+# memory stays at roughly multipart_chunksize * max_concurrency regardless of file size.
+RECORDING_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=4,
+)
+
+# Size the connection pool so that every part of every concurrent upload gets a kept-alive
+# connection instead of waiting on (or re-handshaking with) botocore's default pool of 10.
+# "standard" retry mode retries throttling, 5xx and connection errors with exponential backoff
+# and jitter, so a transient failure on one part doesn't fail the whole recording upload.
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=FILE_UPLOADER_MAX_WORKERS * RECORDING_TRANSFER_CONFIG.max_concurrency,
+    retries={"mode": "standard", "max_attempts": 5},
+)
+
+
+def _get_s3_client(endpoint_url=None, region_name=None, access_key_id=None, access_key_secret=None):
+    """Return a cached S3 client for the given credentials, creating it on first use."""
+    key = (endpoint_url, region_name, access_key_id, access_key_secret)
+    s3_client = _s3_clients.get(key)
+    if s3_client is not None:
+        return s3_client
 
-class S3FileUploader:
+    with _s3_clients_lock:
+        # Check again inside lock
+        s3_client = _s3_clients.get(key)
+        if s3_client is None:
+            s3_client = boto3.client("s3", endpoint_url=endpoint_url, region_name=region_name, aws_access_key_id=access_key_id, aws_secret_access_key=access_key_secret, config=S3_CLIENT_CONFIG)
+            _s3_clients[key] = s3_client
+        return s3_client
+
+
+class S3FileUploader(FileUploader):
     def __init__(self, bucket, filename, endpoint_url=None, region_name=None, access_key_id=None, access_key_secret=None):
         """Initialize the S3FileUploader with an S3 bucket name.
 
@@ -16,53 +59,12 @@ class S3FileUploader:
             bucket (str): The name of the S3 bucket to upload to
             filename (str): The name of the to be stored file
         """
-        self.s3_client = boto3.client("s3", endpoint_url=endpoint_url, region_name=region_name, aws_access_key_id=access_key_id, aws_secret_access_key=access_key_secret)
+        super().__init__(filename)
+        self.s3_client = _get_s3_client(endpoint_url=endpoint_url, region_name=region_name, access_key_id=access_key_id, access_key_secret=access_key_secret)
         self.bucket = bucket
-        self.filename = filename
-        self._upload_thread = None
-
-    def upload_file(self, file_path: str, callback=None):
-        """Start an asynchronous upload of a file to S3.
-
-        Args:
-            file_path (str): Path to the local file to upload
-            callback (callable, optional): Function to call when upload completes
-        """
-        self._upload_thread = threading.Thread(target=self._upload_worker, args=(file_path, callback), daemon=True)
-        self._upload_thread.start()
-
-    def _upload_worker(self, file_path: str, callback=None):
-        """Background thread that handles the actual file upload.
-
-        Args:
-            file_path (str): Path to the local file to upload
-            callback (callable, optional): Function to call when upload completes
-        """
-        try:
-            file_path = Path(file_path)
-            if not file_path.exists():
-                raise FileNotFoundError(f"File not found: {file_path}")
-
-            # Upload the file using S3's multipart upload functionality
-            self.s3_client.upload_file(str(file_path), self.bucket, self.filename)
-
-            logger.info(f"Successfully uploaded {file_path} to s3://{self.bucket}/{self.filename}")
-
-            if callback:
-                callback(True)
-
-        except Exception as e:
-            logger.error(f"Upload error: {e}")
-            if callback:
-                callback(False)
 
-    def wait_for_upload(self):
-        """Wait for the current upload to complete."""
-        if self._upload_thread and self._upload_thread.is_alive():
-            self._upload_thread.join()
+    def _upload(self, file_path: Path):
+        # Upload the file using S3's multipart upload functionality
+        self.s3_client.upload_file(str(file_path), self.bucket, self.filename, Config=RECORDING_TRANSFER_CONFIG)
 
-    def delete_file(self, file_path: str):
-        """Delete a file from the local filesystem."""
-        file_path = Path(file_path)
-        if file_path.exists():
-            file_path.unlink()
+        logger.info("Successfully uploaded %s to s3://%s/%s", file_path, self.bucket, self.filename)
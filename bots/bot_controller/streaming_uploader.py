@@ -1,27 +1,32 @@
 import logging
 import os
 import threading
-from io import BytesIO
 from queue import Queue
 
 import boto3
 
 logger = logging.getLogger(__name__)
 
+AWS_ENDPOINT_URL = os.getenv("AWS_ENDPOINT_URL")
+
+# Max number of chunks waiting to be uploaded. When the network can't keep up, upload_part blocks
+# instead of letting the queue grow, so memory stays at roughly this many chunks rather than the whole recording.
+MAX_QUEUED_CHUNKS = 4
+
 
 class StreamingUploader:
     def __init__(self, bucket, key, chunk_size=5242880):  # 5MB chunks
-        self.s3_client = boto3.client("s3", endpoint_url=os.getenv("AWS_ENDPOINT_URL"))
+        self.s3_client = boto3.client("s3", endpoint_url=AWS_ENDPOINT_URL)
         self.bucket = bucket
         self.key = key
         self.chunk_size = chunk_size
-        self.buffer = BytesIO()
+        self.buffer = bytearray()
         self.upload_id = None
         self.parts = []
         self.part_number = 1
 
         # Add upload queue and worker thread
-        self.upload_queue = Queue()
+        self.upload_queue = Queue(maxsize=MAX_QUEUED_CHUNKS)
         self.upload_thread = threading.Thread(target=self._upload_worker, daemon=True)
         self.upload_thread.start()
 
@@ -43,41 +48,39 @@ class StreamingUploader:
 
                 self.parts.append({"PartNumber": part_num, "ETag": response["ETag"]})
             except Exception as e:
-                logging.error(f"Upload error: {e}")
+                logger.error("Upload error: %s", e)
             finally:
                 self.upload_queue.task_done()
 
     def upload_part(self, data):
-        self.buffer.write(data)
+        self.buffer.extend(data)
 
         # Upload complete chunks
-        while self.buffer.tell() >= self.chunk_size:
-            self.buffer.seek(0)
-            chunk = self.buffer.read(self.chunk_size)
+        while len(self.buffer) >= self.chunk_size:
+            # Slicing the bytearray itself would copy the part once more before bytes() copies it again.
+            # The view has to be released before the buffer can be resized below.
+            with memoryview(self.buffer) as view:
+                chunk = bytes(view[: self.chunk_size])
 
             # Queue the chunk for upload instead of uploading directly
             self.upload_queue.put((chunk, self.part_number))
             self.part_number += 1
 
-            # Keep remaining data
-            remaining = self.buffer.read()
-            self.buffer = BytesIO()
-            self.buffer.write(remaining)
+            # Keep remaining data. Deleting from the front of a bytearray just moves its start
+            # pointer, so this doesn't copy the remainder into a new buffer.
+            del self.buffer[: self.chunk_size]
 
     def complete_upload(self):
-        # If we never started a multipart upload (len(self.parts) == 0), do a regular upload
-        if len(self.parts) == 0:
-            self.buffer.seek(0)
-            data = self.buffer.getvalue()
-            self.s3_client.put_object(Bucket=self.bucket, Key=self.key, Body=data)
-            logger.info("len(self.parts) == 0, so did a regular upload")
+        # If we never queued a part, do a regular upload. self.parts can't be used for this check
+        # because it is only filled in once the worker thread has finished uploading a part.
+        if self.part_number == 1:
+            self.s3_client.put_object(Bucket=self.bucket, Key=self.key, Body=bytes(self.buffer))
+            logger.info("No parts were queued, so did a regular upload")
             return
 
         # Upload final part if any data remains
-        if self.buffer.tell() > 0:
-            self.buffer.seek(0)
-            final_chunk = self.buffer.getvalue()
-            self.upload_queue.put((final_chunk, self.part_number))
+        if self.buffer:
+            self.upload_queue.put((bytes(self.buffer), self.part_number))
 
         # Wait for all uploads to complete
         self.upload_queue.join()
@@ -21,6 +21,8 @@ class Command(BaseCommand):
     def __init__(self):
         super().__init__()
         self.namespace = settings.BOT_POD_NAMESPACE
+        self.launch_bot_method = os.getenv("LAUNCH_BOT_METHOD")
+        self._docker_client = None
 
     def create_k8s_client(self):
         try:
@@ -30,7 +32,7 @@ class Command(BaseCommand):
         return client.CoreV1Api()
 
     def retrieve_bot_infrastructure_information(self, bot) -> dict | None:
-        if os.getenv("LAUNCH_BOT_METHOD") == "kubernetes":
+        if self.launch_bot_method == "kubernetes":
             try:
                 return retrieve_bot_pod_information(self.create_k8s_client(), self.namespace, bot.k8s_pod_name())
             except Exception:
@@ -61,9 +63,9 @@ class Command(BaseCommand):
             logger.error(f"Failed to create fatal error {event_sub_type} event for bot {bot.id}: {str(e)}")
 
         # There isn't really a safe way to terminate the bot if it's running as a celery task
-        if os.getenv("LAUNCH_BOT_METHOD") == "kubernetes":
+        if self.launch_bot_method == "kubernetes":
             self._terminate_kubernetes_pod(bot)
-        elif os.getenv("LAUNCH_BOT_METHOD") == "docker-compose-multi-host":
+        elif self.launch_bot_method == "docker-compose-multi-host":
             self._terminate_ephemeral_docker_container(bot)
 
     def _terminate_kubernetes_pod(self, bot):
@@ -83,18 +85,24 @@ class Command(BaseCommand):
             if pod_error.status != 404:
                 logger.warning(f"Error deleting pod {pod_name}: {str(pod_error)}")
 
+    def _get_docker_client(self):
+        # Reuse one client (and its connection to the daemon) for every bot terminated in this run
+        if self._docker_client is None:
+            self._docker_client = docker.from_env()
+        return self._docker_client
+
     def _terminate_ephemeral_docker_container(self, bot):
         """Remove the ephemeral Docker container for this bot (container name: bot-{id})."""
         try:
-            client = docker.from_env()
+            client = self._get_docker_client()
         except Exception as e:
             logger.warning(f"Cannot connect to Docker to terminate bot {bot.id}: {e}")
             return
 
         container_name = bot.ephemeral_container_name()
         try:
-            container = client.containers.get(container_name)
-            container.remove(force=True)
+            # Force-remove by name in a single request, instead of inspecting the container first and then removing it
+            client.api.remove_container(container_name, force=True)
             logger.info(f"Removed ephemeral container: {container_name}")
         except docker.errors.NotFound:
             # Container already gone, which is fine
@@ -160,8 +168,9 @@ class Command(BaseCommand):
 
         try:
             # Calculate timestamps for 7 days ago and 1 hour ago
-            seven_days_ago = timezone.now() - timezone.timedelta(days=7)
-            one_hour_ago = timezone.now() - timezone.timedelta(hours=1)
+            now = timezone.now()
+            seven_days_ago = now - timezone.timedelta(days=7)
+            one_hour_ago = now - timezone.timedelta(hours=1)
 
             # Find non-post-meeting bots where:
             # - created between 7 days and 1 hour ago AND join_at is null OR join_at is between 7 days and 1 hour ago
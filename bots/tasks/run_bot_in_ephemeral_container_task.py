@@ -1,13 +1,61 @@
 import logging
 import os
+import threading
+import time
 
 import docker
+import requests
 from celery import shared_task
 
 from bots.models import Bot
 
 logger = logging.getLogger(__name__)
 
+# The Docker client keeps a pooled connection to the daemon socket, so one client per worker
+# process is reused across launches instead of reconnecting for every task.
+_docker_client = None
+_docker_client_lock = threading.Lock()
+
+
+def _get_docker_client():
+    global _docker_client
+    if _docker_client is not None:
+        return _docker_client
+
+    with _docker_client_lock:
+        # Check again inside lock
+        if _docker_client is None:
+            _docker_client = docker.from_env()
+        return _docker_client
+
+
+def _reset_docker_client():
+    """Drop the cached Docker client so the next launch reconnects to the daemon."""
+    global _docker_client
+    with _docker_client_lock:
+        client, _docker_client = _docker_client, None
+    if client is not None:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+# Docker-specific or worker-specific vars that shouldn't be in the bot container
+CONTAINER_ENV_VARS_TO_EXCLUDE = frozenset(
+    {
+        "BOT_CONTAINER_IMAGE",  # Only needed by launcher
+        "BOT_MEMORY_LIMIT",  # Only needed by launcher
+        "BOT_CPU_QUOTA",  # Only needed by launcher
+        "BOT_CPU_PERIOD",  # Only needed by launcher
+        "BOT_MAX_EXECUTION_SECONDS",  # Only needed by launcher
+        "BOT_MAX_SIMULTANEOUS_BOTS",  # Only needed by launcher
+        "PULSE_SERVER",  # Each ephemeral container should start its own PulseAudio server
+        "PULSE_RUNTIME_PATH",  # Each container has its own runtime path
+        "XDG_RUNTIME_DIR",  # Each container has its own runtime dir
+    }
+)
+
 
 class BotLauncherCapacityError(Exception):
     """Raised when the maximum number of simultaneous bots is reached."""
@@ -27,15 +75,17 @@ def run_bot_in_ephemeral_container(self, bot_id: int):
     Container auto-removes on exit.
     Celery task returns in ~2 seconds.
     """
-    logger.info(f"Launching ephemeral Docker container for bot {bot_id}")
+    logger.info("Launching ephemeral Docker container for bot %s", bot_id)
 
     try:
         # Connect to Docker daemon
-        client = docker.from_env()
+        client = _get_docker_client()
 
         # Check maximum simultaneous bots limit
         max_simultaneous_bots = int(os.getenv("BOT_MAX_SIMULTANEOUS_BOTS", "100"))
-        running_containers = client.containers.list(filters={"label": "attendee.type=ephemeral-bot", "status": "running"})
+        # sparse=True builds the list from the single /containers/json response. Otherwise docker-py
+        # inspects every running container one by one, which is an extra daemon round-trip per bot.
+        running_containers = client.containers.list(filters={"label": "attendee.type=ephemeral-bot", "status": "running"}, sparse=True)
         current_running_count = len(running_containers)
 
         if current_running_count >= max_simultaneous_bots:
@@ -43,28 +93,14 @@ def run_bot_in_ephemeral_container(self, bot_id: int):
             logger.error(error_msg)
             raise BotLauncherCapacityError(error_msg)
 
-        logger.info(f"Current running bots: {current_running_count}/{max_simultaneous_bots}. Launching bot {bot_id}")
+        logger.info("Current running bots: %s/%s. Launching bot %s", current_running_count, max_simultaneous_bots, bot_id)
 
         # Image to use (same as worker)
         image = os.getenv("BOT_CONTAINER_IMAGE", "attendee-attendee-worker-local:latest")
 
-        # Copy all environment variables from worker to container
+        # Copy all environment variables from worker to container, minus the launcher-specific ones
         # This ensures all env vars (DB, Redis, AWS, Deepgram, etc.) are automatically passed
-        env_vars = os.environ.copy()
-
-        # Remove Docker-specific or worker-specific vars that shouldn't be in the bot container
-        vars_to_exclude = {
-            "BOT_CONTAINER_IMAGE",  # Only needed by launcher
-            "BOT_MEMORY_LIMIT",  # Only needed by launcher
-            "BOT_CPU_QUOTA",  # Only needed by launcher
-            "BOT_CPU_PERIOD",  # Only needed by launcher
-            "BOT_MAX_EXECUTION_SECONDS",  # Only needed by launcher
-            "BOT_MAX_SIMULTANEOUS_BOTS",  # Only needed by launcher
-            "PULSE_SERVER",  # Each ephemeral container should start its own PulseAudio server
-            "PULSE_RUNTIME_PATH",  # Each container has its own runtime path
-            "XDG_RUNTIME_DIR",  # Each container has its own runtime dir
-        }
-        env_vars = {k: v for k, v in env_vars.items() if k not in vars_to_exclude}
+        env_vars = {k: v for k, v in os.environ.items() if k not in CONTAINER_ENV_VARS_TO_EXCLUDE}
 
         # Resource limits per bot (configurable)
         mem_limit = os.getenv("BOT_MEMORY_LIMIT", "2g")  # 2GB default
@@ -72,7 +108,8 @@ def run_bot_in_ephemeral_container(self, bot_id: int):
         cpu_period = int(os.getenv("BOT_CPU_PERIOD", "100000"))
 
         # Get bot to retrieve max_uptime_seconds (Bot.DoesNotExist propagates)
-        bot = Bot.objects.get(id=bot_id)
+        # Only load the columns needed for the settings lookup and the container name
+        bot = Bot.objects.only("id", "object_id", "settings").get(id=bot_id)
         automatic_leave_settings = bot.automatic_leave_settings()
         bot_max_uptime = automatic_leave_settings.get("max_uptime_seconds")
 
@@ -82,11 +119,11 @@ def run_bot_in_ephemeral_container(self, bot_id: int):
         # Calculate timeout = max_uptime_seconds + 1h (3600s) if defined, otherwise use default
         if bot_max_uptime is not None:
             max_execution_seconds = bot_max_uptime + 3600  # + 1h margin
-            logger.info(f"Bot {bot_id} has max_uptime_seconds={bot_max_uptime}, setting container timeout to {max_execution_seconds}s")
+            logger.info("Bot %s has max_uptime_seconds=%s, setting container timeout to %ss", bot_id, bot_max_uptime, max_execution_seconds)
         else:
             # No max_uptime defined, use default (4h)
             max_execution_seconds = int(os.getenv("BOT_MAX_EXECUTION_SECONDS", "14400"))
-            logger.info(f"Bot {bot_id} has no max_uptime_seconds, using default timeout {max_execution_seconds}s")
+            logger.info("Bot %s has no max_uptime_seconds, using default timeout %ss", bot_id, max_execution_seconds)
 
         # Command to execute in container with timeout
         # timeout forces stop after max_execution_seconds
@@ -128,25 +165,23 @@ def run_bot_in_ephemeral_container(self, bot_id: int):
         # Log container info and how to view logs
         log_instruction = f"View logs with: docker logs -f {container_name}" if not auto_remove else "Container will auto-remove when done. To keep containers, set BOT_CONTAINER_AUTO_REMOVE=false"
 
-        logger.info(f"Ephemeral container {container_name} (ID: {container.short_id}) started for bot {bot_id}. {log_instruction}")
+        logger.info("Ephemeral container %s (ID: %s) started for bot %s. %s", container_name, container.short_id, bot_id, log_instruction)
 
         # Try to capture and log initial container output (first few lines)
         try:
             # Wait a moment for container to start producing output
-            import time
-
             time.sleep(0.5)
             logs = container.logs(tail=20, stdout=True, stderr=True).decode("utf-8", errors="replace")
             if logs.strip():
-                logger.info(f"Initial logs from {container_name}:\n{logs}")
+                logger.info("Initial logs from %s:\n%s", container_name, logs)
         except Exception as e:
             # If we can't get logs yet, that's okay - container might not have started outputting
-            logger.debug(f"Could not retrieve initial logs from {container_name}: {e}")
+            logger.debug("Could not retrieve initial logs from %s: %s", container_name, e)
 
         # If auto-remove is enabled, start a background task to periodically capture logs
         # This helps see logs even if container is removed
         if auto_remove:
-            logger.info(f"💡 Tip: To see full logs, run: sudo docker logs -f {container_name} (while container is running) or set BOT_CONTAINER_AUTO_REMOVE=false to keep containers")
+            logger.info("💡 Tip: To see full logs, run: sudo docker logs -f %s (while container is running) or set BOT_CONTAINER_AUTO_REMOVE=false to keep containers", container_name)
 
         return {
             "container_id": container.short_id,
@@ -156,11 +191,16 @@ def run_bot_in_ephemeral_container(self, bot_id: int):
         }
 
     except docker.errors.ImageNotFound:
-        logger.error(f"Image {image} not found. Cannot launch bot {bot_id}")
+        logger.error("Image %s not found. Cannot launch bot %s", image, bot_id)
         raise
     except docker.errors.APIError as e:
-        logger.error(f"Docker API error while launching bot {bot_id}: {str(e)}")
+        logger.error("Docker API error while launching bot %s: %s", bot_id, e)
+        raise
+    except requests.exceptions.ConnectionError as e:
+        # The daemon went away (e.g. it was restarted), so don't keep reusing the dead connection
+        logger.error("Lost connection to Docker daemon while launching bot %s: %s", bot_id, e)
+        _reset_docker_client()
         raise
     except Exception as e:
-        logger.error(f"Error launching ephemeral container for bot {bot_id}: {str(e)}", exc_info=True)
+        logger.error("Error launching ephemeral container for bot %s: %s", bot_id, e, exc_info=True)
         raise
@@ -0,0 +1,104 @@
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
+from django.test import TestCase
+
+from bots.bot_controller.audio_chunk_uploader import UPLOAD_MAX_ATTEMPTS, AudioChunkUploader
+
+
+def _client_error(status_code):
+    return ClientError({"Error": {"Code": str(status_code)}, "ResponseMetadata": {"HTTPStatusCode": status_code}}, "PutObject")
+
+
+class AudioChunkUploaderRetryTest(TestCase):
+    def setUp(self):
+        self.storage = MagicMock()
+        storages_patcher = patch("bots.bot_controller.audio_chunk_uploader.storages", {"audio_chunks": self.storage})
+        storages_patcher.start()
+        self.addCleanup(storages_patcher.stop)
+
+        sleep_patcher = patch("bots.bot_controller.audio_chunk_uploader.time.sleep")
+        self.mock_sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+        self.uploader = AudioChunkUploader(on_success=MagicMock())
+        self.addCleanup(self.uploader.shutdown)
+
+    def test_transient_error_is_retried(self):
+        self.storage.save.side_effect = [ConnectionResetError("reset"), _client_error(503), "stored.pcm"]
+
+        self.assertEqual(self.uploader._upload_one("chunk.pcm", b"\x00\x01"), "stored.pcm")
+        self.assertEqual(self.storage.save.call_count, 3)
+        self.assertEqual([call.args[0] for call in self.mock_sleep.call_args_list], [1, 2])
+
+    def test_gives_up_after_max_attempts(self):
+        self.storage.save.side_effect = ConnectionResetError("reset")
+
+        with self.assertRaises(ConnectionResetError):
+            self.uploader._upload_one("chunk.pcm", b"\x00\x01")
+        self.assertEqual(self.storage.save.call_count, UPLOAD_MAX_ATTEMPTS)
+
+    def test_client_error_is_not_retried(self):
+        self.storage.save.side_effect = _client_error(403)
+
+        with self.assertRaises(ClientError):
+            self.uploader._upload_one("chunk.pcm", b"\x00\x01")
+        self.assertEqual(self.storage.save.call_count, 1)
+        self.mock_sleep.assert_not_called()
+
+    def test_non_transport_error_is_not_retried(self):
+        self.storage.save.side_effect = ValueError("invalid filename")
+
+        with self.assertRaises(ValueError):
+            self.uploader._upload_one("chunk.pcm", b"\x00\x01")
+        self.assertEqual(self.storage.save.call_count, 1)
+        self.mock_sleep.assert_not_called()
+
+
+class AudioChunkUploaderProcessUploadsTest(TestCase):
+    def setUp(self):
+        self.storage = MagicMock()
+        storages_patcher = patch("bots.bot_controller.audio_chunk_uploader.storages", {"audio_chunks": self.storage})
+        storages_patcher.start()
+        self.addCleanup(storages_patcher.stop)
+
+        self.on_success = MagicMock()
+        self.on_error = MagicMock()
+        self.uploader = AudioChunkUploader(on_success=self.on_success, on_error=self.on_error)
+
+    def test_completed_uploads_are_dispatched_once(self):
+        self.storage.save.side_effect = lambda filename, content: f"stored/{filename}"
+
+        self.uploader.upload(audio_chunk_id=1, filename="one.pcm", data=b"\x00")
+        self.uploader.upload(audio_chunk_id=2, filename="two.pcm", data=b"\x01")
+        # Joins the worker threads, so both uploads (and their done callbacks) have finished
+        self.uploader.shutdown(wait=True)
+
+        self.uploader.process_uploads()
+        self.uploader.process_uploads()
+
+        self.assertEqual(sorted(call.args for call in self.on_success.call_args_list), [(1, "stored/one.pcm"), (2, "stored/two.pcm")])
+        self.on_error.assert_not_called()
+        self.assertEqual(self.uploader._pending_uploads, {})
+
+    def test_failed_upload_calls_on_error_with_data(self):
+        self.storage.save.side_effect = _client_error(403)
+
+        self.uploader.upload(audio_chunk_id=1, filename="one.pcm", data=b"\x00")
+        self.uploader.shutdown(wait=True)
+        self.uploader.process_uploads()
+
+        self.on_success.assert_not_called()
+        self.on_error.assert_called_once()
+        self.assertEqual(self.on_error.call_args.kwargs["audio_chunk_id"], 1)
+        self.assertEqual(self.on_error.call_args.kwargs["data"], b"\x00")
+
+    def test_wait_for_uploads_processes_pending_uploads(self):
+        self.storage.save.side_effect = lambda filename, content: f"stored/{filename}"
+
+        self.uploader.upload(audio_chunk_id=1, filename="one.pcm", data=b"\x00")
+        self.uploader.wait_for_uploads(timeout=5.0)
+        self.addCleanup(self.uploader.shutdown)
+
+        self.on_success.assert_called_once_with(1, "stored/one.pcm")
+        self.assertEqual(self.uploader._pending_uploads, {})
@@ -0,0 +1,76 @@
+import datetime
+import os
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import Organization
+from bots.bot_controller.bot_resource_snapshot_taker import BotResourceSnapshotTaker
+from bots.models import Bot, BotResourceSnapshot, Project
+
+MODULE = "bots.bot_controller.bot_resource_snapshot_taker"
+
+
+@patch.dict(os.environ, {"SAVE_BOT_RESOURCE_SNAPSHOTS": "true"})
+class BotResourceSnapshotTakerTest(TestCase):
+    def setUp(self):
+        self.organization = Organization.objects.create(name="Test Organization")
+        self.project = Project.objects.create(name="Test Project", organization=self.organization)
+        self.bot = Bot.objects.create(name="Test Bot", project=self.project, meeting_url="https://meet.google.com/abc-defg-hij")
+
+        # Drive the snapshot taker's clock by hand so each call lands in the window we want
+        self.now = timezone.now()
+        patchers = [
+            patch(f"{MODULE}.timezone", now=lambda: self.now),
+            patch(f"{MODULE}.get_public_ip", return_value="203.0.113.7"),
+            patch(f"{MODULE}.get_cpu_usage_millicores", side_effect=[1_000, 31_000]),
+            patch(f"{MODULE}.container_memory_mib", return_value=512),
+            patch(f"{MODULE}.get_network_interface_stats", return_value=None),
+            patch(f"{MODULE}.get_process_memory_list", return_value=[]),
+            patch(f"{MODULE}.get_db_connection_count", return_value=1),
+            patch(f"{MODULE}.get_redis_connection_count", return_value=2),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.snapshot_taker = BotResourceSnapshotTaker(self.bot)
+        self.addCleanup(self.snapshot_taker.shutdown)
+
+    def advance(self, seconds):
+        self.now += datetime.timedelta(seconds=seconds)
+
+    def start_snapshot(self):
+        # First CPU sample after 30 seconds, then the snapshot itself is collected on the worker after a minute
+        self.advance(31)
+        self.snapshot_taker.save_snapshot_if_needed()
+        self.advance(30)
+        self.snapshot_taker.save_snapshot_if_needed()
+
+    def test_collected_snapshot_is_saved_on_next_call(self):
+        self.start_snapshot()
+        self.snapshot_taker._snapshot_future.result(timeout=5)
+        self.assertEqual(BotResourceSnapshot.objects.filter(bot=self.bot).count(), 0)
+
+        self.advance(1)
+        self.snapshot_taker.save_snapshot_if_needed()
+
+        snapshot = BotResourceSnapshot.objects.get(bot=self.bot)
+        self.assertEqual(snapshot.data["ram_usage_megabytes"], 512)
+        self.assertEqual(snapshot.data["cpu_usage_millicores"], 1_000)
+        self.assertEqual(snapshot.data["db_connection_count"], 1)
+        self.assertEqual(snapshot.data["redis_connection_count"], 2)
+        self.assertIsNone(self.snapshot_taker._snapshot_future)
+
+    def test_shutdown_saves_snapshot_in_flight(self):
+        self.start_snapshot()
+
+        self.snapshot_taker.shutdown()
+
+        self.assertEqual(BotResourceSnapshot.objects.filter(bot=self.bot).count(), 1)
+
+        # Calls after shutdown are ignored instead of submitting to the stopped executor
+        self.advance(120)
+        self.snapshot_taker.save_snapshot_if_needed()
+        self.assertEqual(BotResourceSnapshot.objects.filter(bot=self.bot).count(), 1)
@@ -0,0 +1,31 @@
+import json
+import logging
+from datetime import datetime, timezone
+
+from django.test import TestCase
+
+from attendee.logging import ISOJsonFormatter
+
+
+class ISOJsonFormatterTest(TestCase):
+    def setUp(self):
+        self.formatter = ISOJsonFormatter("%(timestamp)s %(name)s %(levelname)s %(message)s")
+
+    def format_timestamp(self, created):
+        record = logging.LogRecord(name="test", level=logging.INFO, pathname=__file__, lineno=1, msg="hello", args=None, exc_info=None)
+        record.created = created
+        return json.loads(self.formatter.format(record))["timestamp"]
+
+    def test_timestamp_format(self):
+        self.assertEqual(self.format_timestamp(1700000000.25), "2023-11-14T22:13:20.250000+00:00")
+
+    def test_whole_second_keeps_microseconds(self):
+        self.assertEqual(self.format_timestamp(1700000000.0), "2023-11-14T22:13:20.000000+00:00")
+
+    def test_microseconds_round_like_datetime(self):
+        for created in (1700000000.1234567, 1700000000.9999996, 1700000001.000001):
+            expected = datetime.fromtimestamp(created, tz=timezone.utc).isoformat(timespec="microseconds")
+            self.assertEqual(self.format_timestamp(created), expected)
+
+    def test_rounding_carries_into_next_second(self):
+        self.assertEqual(self.format_timestamp(1700000000.9999996), "2023-11-14T22:13:21.000000+00:00")
@@ -0,0 +1,64 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+from django.test import TestCase
+
+from bots.bot_controller.per_participant_non_streaming_audio_input_manager import PerParticipantNonStreamingAudioInputManager
+from bots.utils import calculate_normalized_rms
+
+
+def _tone(amplitude, num_samples=160):
+    return np.full(num_samples, amplitude, dtype=np.int16).tobytes()
+
+
+class CalculateNormalizedRmsTest(TestCase):
+    def test_full_scale_samples_do_not_overflow(self):
+        samples = np.array([32767, -32768] * 160, dtype=np.int16)
+
+        self.assertAlmostEqual(calculate_normalized_rms(samples.tobytes()), 1.0, places=4)
+
+    def test_matches_float64_reference(self):
+        samples = np.random.default_rng(0).integers(-32768, 32768, size=480, dtype=np.int16)
+        expected = np.sqrt(np.mean(samples.astype(np.float64) ** 2)) / 32768
+
+        self.assertAlmostEqual(calculate_normalized_rms(samples.tobytes()), expected, places=12)
+
+    def test_silence_is_zero(self):
+        self.assertEqual(calculate_normalized_rms(bytes(640)), 0.0)
+
+    def test_too_short_input_is_zero(self):
+        self.assertEqual(calculate_normalized_rms(b""), 0.0)
+        self.assertEqual(calculate_normalized_rms(b"\x01"), 0.0)
+
+
+class SilenceDetectedTest(TestCase):
+    def setUp(self):
+        self.manager = PerParticipantNonStreamingAudioInputManager(
+            save_audio_chunk_callback=MagicMock(),
+            get_participant_callback=MagicMock(),
+            sample_rate=16000,
+            utterance_size_limit=16000 * 2 * 10,
+            silence_duration_limit=3,
+            should_print_diagnostic_info=False,
+        )
+        self.manager.vad = MagicMock()
+
+    def test_loud_chunk_skips_vad(self):
+        self.assertFalse(self.manager.silence_detected(_tone(8000)))
+
+        self.manager.vad.is_speech.assert_not_called()
+        self.assertEqual(self.manager.diagnostic_info["total_chunks_marked_as_speech_due_to_rms_being_large"], 1)
+
+    def test_moderate_chunk_uses_vad(self):
+        self.manager.vad.is_speech.return_value = False
+
+        self.assertTrue(self.manager.silence_detected(_tone(1000)))
+
+        self.manager.vad.is_speech.assert_called_once()
+        self.assertEqual(self.manager.diagnostic_info["total_chunks_marked_as_silent_due_to_vad"], 1)
+
+    def test_quiet_chunk_is_silent_without_vad(self):
+        self.assertTrue(self.manager.silence_detected(_tone(100)))
+
+        self.manager.vad.is_speech.assert_not_called()
+        self.assertEqual(self.manager.diagnostic_info["total_chunks_marked_as_silent_due_to_rms_being_small"], 1)
@@ -1,5 +1,6 @@
 import io
 import logging
+import math
 
 import cv2
 import numpy as np
@@ -131,6 +132,23 @@ def calculate_audio_duration_ms(audio_data: bytes, content_type: str) -> int:
     return duration_ms
 
 
+def calculate_normalized_rms(audio_bytes):
+    # Fewer than 2 bytes can't hold a single 16-bit sample, so treat it as silence
+    if not audio_bytes or len(audio_bytes) < 2:
+        return 0.0
+
+    # Ignore a trailing odd byte instead of letting frombuffer raise on it
+    samples = np.frombuffer(audio_bytes, dtype=np.int16, count=len(audio_bytes) // 2)
+
+    # int16 samples are always finite, so no NaN/inf checks are needed. Squaring in int16 would wrap
+    # around for loud samples, so sum the squares as a single int64 dot product, which is exact.
+    samples = samples.astype(np.int64)
+    mean_square = int(np.dot(samples, samples)) / samples.size
+
+    # Normalize by max possible value for 16-bit audio (32768)
+    return math.sqrt(mean_square) / 32768
+
+
 def create_zero_pcm_audio(audio_format, duration_ms=250):
     """Create zero'd PCM audio for the given format and duration"""
     # Parse the audio format to get sample rate and format